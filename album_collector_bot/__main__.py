@@ -10,11 +10,20 @@ from collections.abc import (Sequence)
 from telegram.constants import UpdateType
 
 from album_collector_bot import create_app
+from album_collector_bot.app import _configure_logging
 from album_collector_bot.config import Settings
 
 MIN_TOKEN_LENGTH = 32
 MAX_TOKEN_LENGTH = 256
 
+# UpdateType members are str, so this tuple is already in the wire format
+# and is reused as-is for every getUpdates request.
+_ALLOWED_UPDATES: tuple[str, ...] = (
+    UpdateType.MESSAGE,
+    UpdateType.CALLBACK_QUERY,
+    UpdateType.EDITED_MESSAGE,
+)
+
 
 def generate_token_secure(length=None):
     """
@@ -37,34 +46,42 @@ def generate_token_secure(length=None):
             f"Token length must be at least {MIN_TOKEN_LENGTH} characters for security."
         )
 
-    return secrets.token_urlsafe(length)[:length]
+    # token_urlsafe yields ~4/3 characters per byte, so request only the
+    # bytes needed for `length` characters instead of `length` full bytes.
+    nbytes = (length * 3 + 3) // 4
+    return secrets.token_urlsafe(nbytes)[:length]
 
 
 def main(args: Sequence[str] | None = None):
     """
     Main function
     """
+    if sys.platform != "win32":
+        try:
+            import uvloop
+
+            uvloop.install()
+        except ImportError:
+            pass
+
     settings = Settings(args=args)
+    _configure_logging(settings.LOG_LEVEL)
     app = create_app(settings=settings)
-    allowed_updates = [
-        UpdateType.MESSAGE,
-        UpdateType.CALLBACK_QUERY,
-        UpdateType.EDITED_MESSAGE,
-    ]
-    if settings.WEBHOOK_IP:
+    if settings.WEBHOOK_IP or settings.WEBHOOK_URL:
         if not settings.WEBHOOK_SECRET_TOKEN:
             settings.WEBHOOK_SECRET_TOKEN = generate_token_secure(32)
 
         app.run_webhook(
-            listen=settings.WEBHOOK_IP,
+            listen=settings.WEBHOOK_IP or "0.0.0.0",
             port=settings.WEBHOOK_PORT,
             url_path=settings.WEBHOOK_PATH,
+            webhook_url=settings.WEBHOOK_URL,
             secret_token=settings.WEBHOOK_SECRET_TOKEN,
-            allowed_updates=allowed_updates,
+            allowed_updates=_ALLOWED_UPDATES,
         )
     else:
         app.run_polling(
-            allowed_updates=allowed_updates,
+            allowed_updates=_ALLOWED_UPDATES,
         )
 
 
@@ -5,12 +5,31 @@ This module contains the Telegram bot application.
 import logging
 
 from telegram.ext import Application
+from telegram.request import HTTPXRequest
 
-from .config import Settings
+from .config import Settings, get_settings
 from .handlers import handlers
 from .persistence import get_persistence
 from .context import custom_context_types
 
+_LOGGING_CONFIGURED = False
+
+
+def _configure_logging(level: str) -> None:
+    """
+    Configure root logging once; re-imports and repeated calls are no-ops.
+    """
+    global _LOGGING_CONFIGURED
+    if _LOGGING_CONFIGURED:
+        return
+    _LOGGING_CONFIGURED = True
+    logging.basicConfig(
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+        level=level,
+    )
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+
+
 async def _post_init(application: Application) -> None:
     """
     Post initialization hook.
@@ -24,16 +43,24 @@ async def _post_init(application: Application) -> None:
 def create_app(settings:Settings|None = None) -> Application:
     """Create the telegram bot application."""
 
-    settings = settings or Settings()
+    settings = settings or get_settings()
 
-    logging.basicConfig(
-        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-        level=settings.LOG_LEVEL,
+    # Separate pools so long-polling getUpdates connections never starve
+    # outbound API calls (copy/delete_messages/send_media_group) made from
+    # handlers.
+    request = HTTPXRequest(
+        connection_pool_size=settings.CONNECTION_POOL_SIZE,
+        pool_timeout=settings.POOL_TIMEOUT,
+    )
+    get_updates_request = HTTPXRequest(
+        connection_pool_size=settings.GET_UPDATES_POOL_SIZE,
+        pool_timeout=settings.POOL_TIMEOUT,
     )
-    logging.getLogger("httpx").setLevel(logging.WARNING)
     application = (
         Application.builder()
         .token(settings.BOT_TOKEN)
+        .request(request)
+        .get_updates_request(get_updates_request)
         .persistence(get_persistence(settings))
         .context_types(custom_context_types)
         .post_init(_post_init)
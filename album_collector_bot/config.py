@@ -5,7 +5,9 @@ Settings can be loaded from environment variables or from .env file.
 """
 
 import os
+import sys
 import argparse
+import functools
 from collections.abc import Sequence
 
 from dotenv import load_dotenv
@@ -13,6 +15,63 @@ from dotenv import load_dotenv
 load_dotenv()
 
 
+@functools.cache
+def _build_parser() -> argparse.ArgumentParser:
+    """
+    Build the command line parser once; building it is pure Python and slow.
+    """
+    parser = argparse.ArgumentParser(
+        prog="AlbumCreatorBot",
+        description="AlbumCreatorBot is a Telegram bot that allows you to create albums of photos and videos.",
+    )
+    parser.add_argument(
+        "--log-level", "-l", type=str, help="Log level.", dest="LOG_LEVEL"
+    )
+    parser.add_argument(
+        "--bot-token", "-t", type=str, help="Telegram bot token.", dest="_BOT_TOKEN"
+    )
+    parser.add_argument(
+        "--redis-url", "-r", type=str, help="Redis URL.", dest="REDIS_URL"
+    )
+    parser.add_argument(
+        "--webhook-ip",
+        "-i",
+        type=str,
+        help="Webhook IP address.",
+        dest="WEBHOOK_IP",
+    )
+    parser.add_argument(
+        "--webhook-port", "-p", type=int, help="Webhook port.", dest="WEBHOOK_PORT"
+    )
+    parser.add_argument(
+        "--webhook-path", "-w", type=str, help="Webhook path.", dest="WEBHOOK_PATH"
+    )
+    parser.add_argument(
+        "--webhook-secret-token",
+        "-s",
+        type=str,
+        help="Webhook secret token.",
+        dest="WEBHOOK_SECRET_TOKEN",
+    )
+    parser.add_argument(
+        "--webhook-url", "-u", type=str, help="Webhook URL.", dest="WEBHOOK_URL"
+    )
+    parser.add_argument(
+        "--ydb-endpoint", "-e", type=str, help="YDB endpoint.", dest="YDB_ENDPOINT"
+    )
+    parser.add_argument(
+        "--ydb-database", "-d", type=str, help="YDB database.", dest="YDB_DATABASE"
+    )
+    parser.add_argument(
+        "--ydb-table-prefix",
+        "-x",
+        type=str,
+        help="YDB table prefix.",
+        dest="YDB_TABLE_PREFIX",
+    )
+    return parser
+
+
 class Settings:
     """
     Application settings.
@@ -23,11 +82,20 @@ class Settings:
         BOT_TOKEN: str = Telegram bot token. Required.
         REDIS_URL: Optional[str] = Redis URL.
 
-        WEBHOOK_IP: Optional[str] = Webhook IP address. If not set, bot will run in long polling mode.
+        CONNECTION_POOL_SIZE: int = HTTPX connection pool size for outbound bot API calls. Default is 32.
+        GET_UPDATES_POOL_SIZE: int = HTTPX connection pool size for getUpdates. Default is 4.
+        POOL_TIMEOUT: float = Seconds to wait for a free pool connection. Default is 10.0.
+
+        WEBHOOK_IP: Optional[str] = Webhook listen address. Defaults to "0.0.0.0" when WEBHOOK_URL is set.
         WEBHOOK_PORT: int = Webhook port. Default is 8080.
         WEBHOOK_PATH: str = Webhook path. Default is "/webhook".
         WEBHOOK_SECRET_TOKEN: Optional[str] = Webhook secret token.
-        WEBHOOK_URL: Optional[str] = Webhook URL.
+        WEBHOOK_URL: Optional[str] = Public webhook URL, registered with Telegram via setWebhook.
+
+        The bot runs in webhook mode when WEBHOOK_IP or WEBHOOK_URL is set;
+        long polling is the fallback intended for local development only.
+
+        PERSISTENCE_UPDATE_INTERVAL: float = Seconds between background persistence flushes. Default is 60.0.
 
         YDB_ENDPOINT: Optional[str] = YDB endpoint.
         YDB_DATABASE: Optional[str] = YDB database.
@@ -44,6 +112,24 @@ class Settings:
         # Redis settings
         self.REDIS_URL: str | None = os.getenv("REDIS_URL")
 
+        # HTTPX connection pool settings
+        try:
+            self.CONNECTION_POOL_SIZE: int = int(
+                os.environ.get("CONNECTION_POOL_SIZE", "32")
+            )
+        except ValueError as exc:
+            raise ValueError("CONNECTION_POOL_SIZE must be an integer.") from exc
+        try:
+            self.GET_UPDATES_POOL_SIZE: int = int(
+                os.environ.get("GET_UPDATES_POOL_SIZE", "4")
+            )
+        except ValueError as exc:
+            raise ValueError("GET_UPDATES_POOL_SIZE must be an integer.") from exc
+        try:
+            self.POOL_TIMEOUT: float = float(os.environ.get("POOL_TIMEOUT", "10.0"))
+        except ValueError as exc:
+            raise ValueError("POOL_TIMEOUT must be a number.") from exc
+
         # Webhook settings
         self.WEBHOOK_IP: str | None = os.getenv("WEBHOOK_IP")
         try:
@@ -54,6 +140,14 @@ class Settings:
         self.WEBHOOK_SECRET_TOKEN: str | None = os.getenv("WEBHOOK_SECRET_TOKEN")
         self.WEBHOOK_URL: str | None = os.getenv("WEBHOOK_URL")
 
+        # Persistence settings
+        try:
+            self.PERSISTENCE_UPDATE_INTERVAL: float = float(
+                os.environ.get("PERSISTENCE_UPDATE_INTERVAL", "60.0")
+            )
+        except ValueError as exc:
+            raise ValueError("PERSISTENCE_UPDATE_INTERVAL must be a number.") from exc
+
         # YDB settings
         self.YDB_ENDPOINT: str | None = os.getenv("YDB_ENDPOINT")
         self.YDB_DATABASE: str | None = os.getenv("YDB_DATABASE")
@@ -61,6 +155,15 @@ class Settings:
         
         if args:
             self.parse_args(args=args)
+
+        # Computed once, after argument overrides, so the property is a
+        # plain attribute read.
+        self._use_ydb: bool = bool(
+            self.YDB_ENDPOINT
+            and self.YDB_DATABASE
+            and self.YDB_ENDPOINT.strip()
+            and self.YDB_DATABASE.strip()
+        )
     
     @property
     def BOT_TOKEN(self) -> str:
@@ -80,65 +183,22 @@ class Settings:
         Returns:
             bool: True if YDB is used, False otherwise.
         """
-        return (
-            isinstance(self.YDB_ENDPOINT, str)
-            and isinstance(self.YDB_DATABASE, str)
-            and self.YDB_ENDPOINT.strip() != ""
-            and self.YDB_DATABASE.strip() != ""
-        )
+        return self._use_ydb
 
     def parse_args(self, args: Sequence[str] | None = None) -> None:
         """
         Parse command line arguments.
         """
-        parser = argparse.ArgumentParser(
-            prog="AlbumCreatorBot",
-            description="AlbumCreatorBot is a Telegram bot that allows you to create albums of photos and videos.",
-        )
-        parser.add_argument(
-            "--log-level", "-l", type=str, help="Log level.", dest="LOG_LEVEL"
-        )
-        parser.add_argument(
-            "--bot-token", "-t", type=str, help="Telegram bot token.", dest="_BOT_TOKEN"
-        )
-        parser.add_argument(
-            "--redis-url", "-r", type=str, help="Redis URL.", dest="REDIS_URL"
-        )
-        parser.add_argument(
-            "--webhook-ip",
-            "-i",
-            type=str,
-            help="Webhook IP address.",
-            dest="WEBHOOK_IP",
-        )
-        parser.add_argument(
-            "--webhook-port", "-p", type=int, help="Webhook port.", dest="WEBHOOK_PORT"
-        )
-        parser.add_argument(
-            "--webhook-path", "-w", type=str, help="Webhook path.", dest="WEBHOOK_PATH"
-        )
-        parser.add_argument(
-            "--webhook-secret-token",
-            "-s",
-            type=str,
-            help="Webhook secret token.",
-            dest="WEBHOOK_SECRET_TOKEN",
-        )
-        parser.add_argument(
-            "--webhook-url", "-u", type=str, help="Webhook URL.", dest="WEBHOOK_URL"
-        )
-        parser.add_argument(
-            "--ydb-endpoint", "-e", type=str, help="YDB endpoint.", dest="YDB_ENDPOINT"
-        )
-        parser.add_argument(
-            "--ydb-database", "-d", type=str, help="YDB database.", dest="YDB_DATABASE"
-        )
-        parser.add_argument(
-            "--ydb-table-prefix",
-            "-x",
-            type=str,
-            help="YDB table prefix.",
-            dest="YDB_TABLE_PREFIX",
-        )
+        # In production the bot is started without flags; don't even build
+        # the parser when there is nothing to parse.
+        if args is None and len(sys.argv) <= 1:
+            return
+        _build_parser().parse_args(args=args, namespace=self)
+
 
-        parser.parse_args(args=args, namespace=self)
+@functools.lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Get the environment-derived settings, parsing the environment only once.
+    """
+    return Settings()
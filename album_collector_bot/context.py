@@ -7,7 +7,7 @@ from telegram.ext import ContextTypes, CallbackContext, ExtBot
 from telegram import InputMediaPhoto, InputMediaVideo
 
 
-@dataclass
+@dataclass(slots=True)
 class MediaItem:
     """
     Class for storing media item.
@@ -16,7 +16,7 @@ class MediaItem:
     item: InputMediaPhoto | InputMediaVideo
     message_id: int
     
-@dataclass
+@dataclass(slots=True)
 class CaptionItem:
     """
     Class for storing description item.
@@ -25,14 +25,19 @@ class CaptionItem:
     message_id: int
 
 
-@dataclass
+@dataclass(slots=True)
 class UserData:
     """
     Class for storing user data.
     """
 
-    media_messages: list[MediaItem] = field(default_factory=list)
+    # Keyed by message_id for O(1) delete/update lookups; dict preserves
+    # insertion order, so album order is kept.
+    media_messages: dict[int, MediaItem] = field(default_factory=dict)
     caption_message: CaptionItem | None = None
+    # Lazily built media list for reply_media_group; invalidated whenever
+    # media_messages changes.
+    media_list_cache: list[InputMediaPhoto | InputMediaVideo] | None = None
 
     def clear(self):
         """
@@ -40,6 +45,7 @@ class UserData:
         """
         self.media_messages.clear()
         self.caption_message = None
+        self.media_list_cache = None
 
 
 class CustomContext(CallbackContext[ExtBot, UserData, dict, dict]):
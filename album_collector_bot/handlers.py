@@ -32,12 +32,36 @@ from telegram.error import TelegramError
 from telegram.constants import MediaGroupLimit
 from .context import CustomContext, MediaItem, CaptionItem
 
+import asyncio
 import logging
 
 logger = logging.getLogger(__name__)
 
 QUERY_DELETE = "delete"
 
+_MIN_MEDIA_LENGTH = int(MediaGroupLimit.MIN_MEDIA_LENGTH)
+_MAX_MEDIA_LENGTH = int(MediaGroupLimit.MAX_MEDIA_LENGTH)
+
+# The Delete keyboard is identical for every media message, so build it once.
+_DELETE_MARKUP = InlineKeyboardMarkup(
+    [
+        [
+            InlineKeyboardButton(
+                "Delete",
+                callback_data=QUERY_DELETE,
+            )
+        ]
+    ]
+)
+
+
+def _is_delete_query(data: object) -> bool:
+    """
+    Exact-match pattern for the Delete button; avoids the regex machinery
+    CallbackQueryHandler uses for string patterns.
+    """
+    return data == QUERY_DELETE
+
 
 async def cmd_start(update: Update, context: CustomContext) -> None:
     """
@@ -46,10 +70,7 @@ async def cmd_start(update: Update, context: CustomContext) -> None:
     This function sends a welcome message to the user and resets the user's
     album data in the UserContext.
     """
-    assert update.effective_message
-    assert context.user_data is not None
-    context.user_data.media_messages.clear()
-    context.user_data.caption_message = None
+    context.user_data.clear()
     try:
         await update.effective_message.reply_text(
             "Welcome to Album Collector! Please send me a photo or a video and "
@@ -76,8 +97,6 @@ async def add_media(update: Update, context: CustomContext) -> None:
     This function appends the received media to the user's album data in the
     UserContext.
     """
-    assert update.effective_message
-    assert context.user_data is not None
 
     item = _get_message_media(update.effective_message)
     if not item:
@@ -88,22 +107,19 @@ async def add_media(update: Update, context: CustomContext) -> None:
         return
 
     try:
-        # Copy method returns a message ID of copied message
-        new_message_id = await update.effective_message.copy(
-            update.effective_message.chat_id,
-            reply_markup=InlineKeyboardMarkup(
-                [
-                    [
-                        InlineKeyboardButton(
-                            "Delete",
-                            callback_data=QUERY_DELETE,
-                        )
-                    ]
-                ]
+        # Copying and deleting the original are independent round-trips, so
+        # run them concurrently. Copy returns a message ID of copied message.
+        new_message_id, _ = await asyncio.gather(
+            update.effective_message.copy(
+                update.effective_message.chat_id,
+                reply_markup=_DELETE_MARKUP,
             ),
+            update.effective_message.delete(),
+        )
+        context.user_data.media_messages[new_message_id.message_id] = MediaItem(
+            item, new_message_id.message_id
         )
-        context.user_data.media_messages.append(MediaItem(item, new_message_id.message_id))
-        await update.effective_message.delete()
+        context.user_data.media_list_cache = None
     except TelegramError:
         logger.exception("Failed to send media")
 
@@ -112,15 +128,12 @@ async def delete_media(update: Update, context: CustomContext) -> None:
     """
     Handles the delete button click.
     """
-    assert update.callback_query
     await update.callback_query.answer()
 
-    assert context.user_data is not None
-    assert update.effective_message
-    for media in list(context.user_data.media_messages):
-        if media.message_id == update.effective_message.message_id:
-            context.user_data.media_messages.remove(media)
-            break
+    if context.user_data.media_messages.pop(
+        update.effective_message.message_id, None
+    ):
+        context.user_data.media_list_cache = None
     try:
         await update.callback_query.delete_message()
     except TelegramError:
@@ -131,8 +144,6 @@ async def add_description(update: Update, context: CustomContext) -> None:
     """
     Handles messages containing a description.
     """
-    assert update.effective_message
-    assert context.user_data is not None
     if update.effective_message.text:
         context.user_data.caption_message = CaptionItem(
             caption=update.effective_message.text,
@@ -144,14 +155,15 @@ async def update_message(update: Update, context: CustomContext) -> None:
     """
     Handles edited messages.
     """
-    assert update.effective_message
-    assert context.user_data is not None
     if update.effective_message.photo or update.effective_message.video:
-        for media in context.user_data.media_messages:
-            if media.message_id == update.effective_message.message_id:
-                item = _get_message_media(update.effective_message)
-                if item:
-                    media.item = item
+        media = context.user_data.media_messages.get(
+            update.effective_message.message_id
+        )
+        if media:
+            item = _get_message_media(update.effective_message)
+            if item:
+                media.item = item
+                context.user_data.media_list_cache = None
     elif update.effective_message.text:
         if context.user_data.caption_message:
             if (
@@ -166,16 +178,16 @@ async def update_message(update: Update, context: CustomContext) -> None:
 async def _clear_album_data(context: CustomContext, chat: Chat | None) -> None:
     if not context.user_data:
         return
-    try:
-        if chat:
-            message_ids = [
-                message.message_id for message in context.user_data.media_messages
-            ]
-            if context.user_data.caption_message:
-                message_ids.append(context.user_data.caption_message.message_id)
+    message_ids = list(context.user_data.media_messages)
+    if context.user_data.caption_message:
+        message_ids.append(context.user_data.caption_message.message_id)
+    # Don't waste an API round-trip on an empty album (e.g. /reset with
+    # nothing collected).
+    if chat and message_ids:
+        try:
             await context.bot.delete_messages(chat.id, message_ids)
-    except TelegramError:
-        logger.exception("Failed to delete messages")
+        except TelegramError:
+            logger.exception("Failed to delete messages")
     context.user_data.clear()
 
 
@@ -185,34 +197,30 @@ async def cmd_collect(update: Update, context: CustomContext) -> None:
 
     This function collects the user's album data and sends it to the user.
     """
-    assert update.effective_message
-    assert update.effective_chat
 
-    assert context.user_data is not None
-    media = [message.item for message in context.user_data.media_messages]
-    if not (
-        MediaGroupLimit.MIN_MEDIA_LENGTH
-        <= len(media)
-        <= MediaGroupLimit.MAX_MEDIA_LENGTH
-    ):
+    media = context.user_data.media_list_cache
+    if media is None:
+        media = [
+            message.item for message in context.user_data.media_messages.values()
+        ]
+        context.user_data.media_list_cache = media
+    if not _MIN_MEDIA_LENGTH <= len(media) <= _MAX_MEDIA_LENGTH:
         await update.effective_message.reply_text(
-            f"Please send me between {MediaGroupLimit.MIN_MEDIA_LENGTH} "
-            f"and {MediaGroupLimit.MAX_MEDIA_LENGTH} media files before using /collect.\n"
+            f"Please send me between {_MIN_MEDIA_LENGTH} "
+            f"and {_MAX_MEDIA_LENGTH} media files before using /collect.\n"
             "You can add more media by sending more photos or videos.\n"
             "To remove media, you can delete your previous messages or use the /reset command to start over."
         )
         return
 
     if context.user_data.caption_message:
-        # media is not empty, checked above
-        if media[0].type == "photo":
-            media[0] = InputMediaPhoto(
-                media[0].media, context.user_data.caption_message.caption
-            )
-        elif media[0].type == "video":
-            media[0] = InputMediaVideo(
-                media[0].media, context.user_data.caption_message.caption
-            )
+        # media is not empty, checked above. InputMedia objects are immutable,
+        # so rebuild only the first element, on a copy to keep the cache clean.
+        first = media[0]
+        media = [
+            type(first)(first.media, context.user_data.caption_message.caption),
+            *media[1:],
+        ]
     try:
         await update.effective_message.reply_media_group(media)
         await _clear_album_data(context, update.effective_chat)
@@ -238,5 +246,5 @@ handlers: list[BaseHandler] = [
     MessageHandler(filters.VIDEO | filters.PHOTO, add_media),
     MessageHandler(filters.TEXT, add_description),
     MessageHandler(filters.UpdateType.EDITED, update_message),
-    CallbackQueryHandler(pattern=QUERY_DELETE, callback=delete_media),
+    CallbackQueryHandler(pattern=_is_delete_query, callback=delete_media),
 ]
@@ -2,14 +2,80 @@
 
 """
 
+from telegram import TelegramObject
 from telegram.ext import DictPersistence
 from .config import Settings
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _orjson_default(obj):
+    """
+    Encode Telegram objects (e.g. the stored InputMediaPhoto/Video) the
+    same way their to_dict() JSON representation would.
+    """
+    if isinstance(obj, TelegramObject):
+        return obj.to_dict()
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+class OrjsonDictPersistence(DictPersistence):
+    """
+    DictPersistence whose JSON snapshots are produced with orjson.
+
+    Only the ``*_data_json`` snapshot properties are overridden; loading
+    from JSON strings still goes through the base class.
+    """
+
+    __slots__ = ()
+
+    @property
+    def user_data_json(self) -> str:
+        if self._user_data_json:
+            return self._user_data_json
+        # OPT_NON_STR_KEYS coerces the int user/chat IDs keying the data
+        # to strings, matching the stdlib json encoder.
+        return orjson.dumps(
+            self.user_data,
+            default=_orjson_default,
+            option=orjson.OPT_NON_STR_KEYS,
+        ).decode()
+
+    @property
+    def chat_data_json(self) -> str:
+        if self._chat_data_json:
+            return self._chat_data_json
+        return orjson.dumps(
+            self.chat_data,
+            default=_orjson_default,
+            option=orjson.OPT_NON_STR_KEYS,
+        ).decode()
+
+    @property
+    def bot_data_json(self) -> str:
+        if self._bot_data_json:
+            return self._bot_data_json
+        return orjson.dumps(
+            self.bot_data,
+            default=_orjson_default,
+            option=orjson.OPT_NON_STR_KEYS,
+        ).decode()
+
+
 def get_persistence(settings: Settings):
     # if settings.use_ydb:
     #     return YDBPersistence()
     # if settings.REDIS_URL:
     #     return RedisPersistence()
     # else:
-    return DictPersistence()
-
+    # The Application flushes persistence from a background task every
+    # update_interval seconds, coalescing writes off the handler path;
+    # a slow backend only pays per interval, not per update.
+    if orjson is not None:
+        return OrjsonDictPersistence(
+            update_interval=settings.PERSISTENCE_UPDATE_INTERVAL
+        )
+    return DictPersistence(update_interval=settings.PERSISTENCE_UPDATE_INTERVAL)